@@ -1,16 +1,15 @@
+import time
+_IMPORT_T0 = time.perf_counter()
+
 from flask import Flask, render_template, jsonify, request, Response
 from datetime import datetime
+from functools import lru_cache
 import json
 import threading
-import time
-import pytz
-import cv2
+import sys
 
 from config import Config
 from db import init_db, get_stat, set_stat, log_event
-from services.openweather import get_openweather
-from services.tago import get_nearby_stops, get_arrivals_by_stop
-from cv.condition_cv import ConditionEstimatorCV
 
 from logic.ai_commute import success_prob
 from logic.ai_behavior import laplace_prob, risk_level
@@ -18,24 +17,36 @@ from logic.ai_checklist import order_checklist
 from logic.policy import apply_policy
 from logic.briefing import make_briefing
 
-app = Flask(__name__, template_folder="web/templates", static_folder="web/static")
-# 라즈베리파이에서 보낸 프레임을 담을 전역 변수
-latest_frame = None 
+# ====== 콜드 스타트 최적화 ======
+# OpenCV/NumPy/pytz/requests 와 Haar cascade 로딩, CV 스레드는 import 시점에 하지 않는다.
+# 무거운 모듈은 실제로 쓰는 함수 안에서 import 하고,
+# DB 초기화 + CV 워커는 start_background() 가 백그라운드 스레드에서 올린다.
+# -> HTTP 소켓이 먼저 열리고 대시보드는 CV 준비 전에도 바로 응답한다 (그동안은 "noface").
 
-@app.route('/upload_frame', methods=['POST'])
-def upload_frame():
-    global latest_frame
-    try:
-        # 라즈베리파이가 보낸 바이트 데이터를 이미지로 변환
-        img_byte = request.data
-        nparr = np.frombuffer(img_byte, np.uint8)
-        latest_frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-        return "OK", 200
-    except Exception as e:
-        return str(e), 500
-init_db()
+# ====== 시작 시간 리포트 ======
+startup_report = []  # [(단계 이름, 소요 ms)]
+_report_lock = threading.Lock()
+
+def _record(label: str, t0: float):
+    ms = round((time.perf_counter() - t0) * 1000.0, 1)
+    with _report_lock:
+        startup_report.append((label, ms))
+    return ms
+
+def _record_since_import(label: str):
+    # app.py import 시작부터의 누적 시간 ("t+" 로 표시)
+    return _record("t+ " + label, _IMPORT_T0)
+
+def print_startup_report():
+    with _report_lock:
+        rows = list(startup_report)
+    print("\n" + "-" * 32)
+    print(" [시작 시간 리포트]")
+    for label, ms in rows:
+        print(f"  {label:<24} {ms:>8.1f} ms")
+    print("-" * 32 + "\n")
 
-tz = pytz.timezone(Config.TZ)
+report_enabled = False  # --startup-report: 서버가 열릴 때와 CV 준비(또는 실패) 시 리포트 출력
 
 # ====== 글로벌 공유 자원 ======
 cv_lock = threading.Lock()
@@ -48,11 +59,16 @@ cv_state = {
     "last_update_ts": 0.0
 }
 
-# 실시간 영상을 공유하기 위한 전역 변수
-latest_frame = None 
+# 라즈베리파이에서 보낸 프레임을 담을 전역 변수 (실시간 영상 공유용)
+latest_frame = None
+
+@lru_cache(maxsize=1)
+def get_tz():
+    import pytz
+    return pytz.timezone(Config.TZ)
 
 def iso_now():
-    return datetime.now(tz).isoformat(timespec="seconds")
+    return datetime.now(get_tz()).isoformat(timespec="seconds")
 
 def safe_int(s: str, default=0):
     try: return int(s)
@@ -62,30 +78,114 @@ def parse_hhmm(s: str) -> int:
     hh, mm = s.split(":")
     return int(hh)*60 + int(mm)
 
-# ====== CV 스레드 (카메라 독점 사용 및 프레임 공유) ======
-# app.py의 cv_loop 예시
+# ====== DB 초기화 (최초 1회) ======
+_db_lock = threading.Lock()
+_db_ready = False
+
+def ensure_db():
+    global _db_ready
+    if _db_ready:
+        return
+    with _db_lock:
+        if not _db_ready:
+            t0 = time.perf_counter()
+            init_db()
+            _record("init_db", t0)
+            _db_ready = True
+
+# ====== CV 스레드 (백그라운드에서 cascade 로딩 후 공유 프레임 분석) ======
+cv_ready = False
+cv_error = None  # CV 초기화 실패 시 에러 메시지
+
 def cv_loop():
-    global latest_frame
-    est = ConditionEstimatorCV() # 이제 파라미터가 필요 없습니다.
-    
+    global cv_ready, cv_error
+    try:
+        t0 = time.perf_counter()
+        from cv.condition_cv import ConditionEstimatorCV  # cv2, numpy import
+        _record("import cv2/numpy", t0)
+
+        t0 = time.perf_counter()
+        est = ConditionEstimatorCV()  # Haar cascade XML 2개 로딩
+        _record("load cascades", t0)
+    except Exception as e:
+        cv_error = f"{type(e).__name__}: {e}"
+        _record_since_import("cv init failed")
+        print(f" [CV 초기화 실패] 에러: {cv_error}")
+    else:
+        cv_ready = True
+        _record_since_import("cv ready")
+
+    if report_enabled:
+        print_startup_report()
+    if not cv_ready:
+        return
+
     while True:
         # 전역 변수에 저장된 프레임을 분석기로 전달합니다.
-        st = est.step(external_frame=latest_frame) 
-        
+        st = est.step(external_frame=latest_frame)
+
         # ... (이후 결과 업데이트 로직) ...
         time.sleep(0.05)
 
-threading.Thread(target=cv_loop, daemon=True).start()
+def _background_startup():
+    try:
+        ensure_db()
+    except Exception as e:
+        # 대시보드 요청 때 ensure_db() 가 다시 시도한다.
+        print(f" [DB 초기화 실패] 에러: {e}")
+
+    # 첫 대시보드 요청이 import 비용을 내지 않도록 pytz / 외부 API 클라이언트(requests)를 미리 로딩
+    t0 = time.perf_counter()
+    try:
+        get_tz()
+        import services.openweather
+        import services.tago
+    except Exception as e:
+        # dashboard() 의 지연 import 가 다시 시도한다.
+        print(f" [클라이언트 로딩 실패] 에러: {e}")
+    else:
+        _record("warm upstream clients", t0)
+
+    cv_loop()
+
+_bg_lock = threading.Lock()
+_bg_started = False
+
+def start_background():
+    """DB 초기화와 CV 워커를 데몬 스레드로 한 번만 시작한다."""
+    global _bg_started
+    if _bg_started:
+        return
+    with _bg_lock:
+        if _bg_started:
+            return
+        _bg_started = True
+    threading.Thread(target=_background_startup, name="cv-worker", daemon=True).start()
+
+# ====== 프레임 수신 (라즈베리파이 -> 서버) ======
+def upload_frame():
+    global latest_frame
+    try:
+        import cv2
+        import numpy as np
+        # 라즈베리파이가 보낸 바이트 데이터를 이미지로 변환
+        img_byte = request.data
+        nparr = np.frombuffer(img_byte, np.uint8)
+        latest_frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        return "OK", 200
+    except Exception as e:
+        return str(e), 500
 
 # ====== 영상 송출 (공유된 프레임을 브라우저로 전송) ======
-@app.route('/video_feed')
 def video_feed():
+    import cv2
+
     def generate():
-        global latest_frame
         while True:
-            if latest_frame is not None:
+            frame = latest_frame
+            if frame is not None:
                 # 거울 반전
-                frame = cv2.flip(latest_frame, 1)
+                frame = cv2.flip(frame, 1)
                 ret, buffer = cv2.imencode('.jpg', frame)
                 if ret:
                     yield (b'--frame\r\n'
@@ -93,11 +193,25 @@ def video_feed():
             time.sleep(0.1) # 전송 부하 감소
     return Response(generate(), mimetype='multipart/x-mixed-replace; boundary=frame')
 
+# ====== 시작 상태 확인 ======
+def api_startup():
+    with _report_lock:
+        rows = list(startup_report)
+    return jsonify({
+        "db_ready": _db_ready,
+        "cv_ready": cv_ready,
+        "cv_error": cv_error,
+        "report_ms": [[label, ms] for label, ms in rows],  # 기록 순서 유지
+    })
+
 # ... (기존 api_interaction, api_nearby, api_arrivals 코드와 동일하므로 중략) ...
 
-@app.route("/")
 def dashboard():
-    now = datetime.now(tz)
+    # 외부 API 클라이언트(requests)는 대시보드 첫 요청 때 로딩
+    from services.openweather import get_openweather
+    from services.tago import get_nearby_stops, get_arrivals_by_stop
+
+    now = datetime.now(get_tz())
     now_min = now.hour * 60 + now.minute
 
     # 1. CV 상태 가져오기
@@ -140,6 +254,7 @@ def dashboard():
     except Exception: pass
 
     # 5. 교통 및 성공 확률 계산
+    ensure_db()
     avg_depart = get_stat("avg_departure_hhmm", "08:10")
     late_7 = safe_int(get_stat("late_count_7days", "0"), 0)
     depart_delay = max(now_min - parse_hhmm(avg_depart), 0)
@@ -182,5 +297,54 @@ def dashboard():
         briefing=brief
     )
 
+# ====== 첫 요청 처리 ======
+_first_request_lock = threading.Lock()
+_first_request_seen = False
+
+def _on_first_request():
+    # 매 요청(/upload_frame 포함)마다 불리므로 플래그만 보고 바로 빠진다.
+    global _first_request_seen
+    if _first_request_seen:
+        return
+    with _first_request_lock:
+        if _first_request_seen:
+            return
+        _first_request_seen = True
+    _record_since_import("first request")
+    # gunicorn 등 __main__ 을 거치지 않는 실행에서도 첫 요청 때 워커를 올린다.
+    start_background()
+
+# ====== 애플리케이션 팩토리 ======
+def create_app() -> Flask:
+    """라우트만 등록한 가벼운 Flask 앱을 만든다.
+
+    CV/DB 상태는 모듈 전역이라 프로세스당 한 번만 호출한다 (아래 `app`).
+    백그라운드 작업은 __main__ 에서 소켓이 열린 뒤, 아니면 첫 요청 때 띄운다.
+    """
+    t0 = time.perf_counter()
+    app = Flask(__name__, template_folder="web/templates", static_folder="web/static")
+
+    app.add_url_rule("/upload_frame", view_func=upload_frame, methods=["POST"])
+    app.add_url_rule("/video_feed", view_func=video_feed)
+    app.add_url_rule("/api/startup", view_func=api_startup)
+    app.add_url_rule("/", view_func=dashboard)
+
+    app.before_request(_on_first_request)
+
+    _record("create_app", t0)
+    return app
+
+_record("import app.py", _IMPORT_T0)
+app = create_app()
+
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8080, debug=False)
\ No newline at end of file
+    from werkzeug.serving import make_server
+
+    report_enabled = "--startup-report" in sys.argv
+    # make_server() 가 bind/listen 까지 끝낸 뒤에 DB/클라이언트/CV 를 백그라운드에서 준비한다.
+    server = make_server("0.0.0.0", 8080, app, threaded=True)
+    _record_since_import("server serving")
+    start_background()
+    if report_enabled:
+        print_startup_report()
+    server.serve_forever()
@@ -0,0 +1,48 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY = ("cv2", "numpy", "pytz", "requests")
+
+
+def _run(code: str, cwd: Path) -> str:
+    # 새 인터프리터에서 실행해야 sys.modules 를 깨끗하게 볼 수 있다.
+    # cwd 를 임시 폴더로 두어 smartmirror.db 를 건드리지 않는다.
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=cwd, capture_output=True, text=True, timeout=60,
+        env={"PYTHONPATH": str(ROOT), "PATH": ""},
+    )
+    assert out.returncode == 0, out.stderr
+    return out.stdout.strip().splitlines()[-1]
+
+
+def test_import_app_has_no_side_effects(tmp_path):
+    line = _run(
+        "import sys, json, threading, app; "
+        f"print(json.dumps([[m for m in {HEAVY!r} if m in sys.modules], "
+        "threading.active_count()]))",
+        tmp_path,
+    )
+    loaded, threads = json.loads(line)
+    assert loaded == []
+    # init_db() 와 CV 스레드도 import 시점에 돌지 않아야 한다.
+    assert not (tmp_path / "smartmirror.db").exists()
+    assert threads == 1
+
+
+def test_api_startup_responds(tmp_path):
+    line = _run(
+        "import json, app; "
+        "r = app.app.test_client().get('/api/startup'); "
+        "print(json.dumps([r.status_code, r.get_json()]))",
+        tmp_path,
+    )
+    status, body = json.loads(line)
+    assert status == 200
+    labels = [label for label, _ in body["report_ms"]]
+    assert "import app.py" in labels
+    assert "t+ first request" in labels